@@ -5,20 +5,37 @@ Creates recurring JIRA epics with minimal input.
 """
 import os
 import sys
-import yaml
+import json
+import time
 import click
+import string
+import hashlib
 import calendar
+import tempfile
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional
 
-from dotenv import load_dotenv
-from jira import JIRA
-from jira.exceptions import JIRAError
-from rich.console import Console
-from rich.table import Table
+# Heavy dependencies (jira, yaml, rich, dotenv) are imported lazily inside
+# the code that needs them so that e.g. --help doesn't pay their import cost.
 
-console = Console()
+
+class _LazyConsole:
+    """Defers the rich import and terminal detection until the first print."""
+
+    _real = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._real is None:
+            from rich.console import Console
+            _LazyConsole._real = Console()
+        return getattr(_LazyConsole._real, name)
+
+
+console = _LazyConsole()
 
 
 # =============================================================================
@@ -29,6 +46,8 @@ class Config:
     """Configuration class for JIRA connection and project settings."""
     
     def __init__(self, env_path: str = None):
+        from dotenv import load_dotenv
+
         if env_path:
             load_dotenv(env_path)
         else:
@@ -66,26 +85,70 @@ class Config:
 def get_first_working_day(year: int, month: int) -> date:
     """Get the first working day (Mon-Fri) of a month."""
     first_day = date(year, month, 1)
-    while first_day.weekday() >= 5:
-        first_day += timedelta(days=1)
-    return first_day
+    weekday = first_day.weekday()
+    # Saturday (5) -> +2 days, Sunday (6) -> +1 day
+    offset = (7 - weekday) % 7 if weekday >= 5 else 0
+    return first_day + timedelta(days=offset)
 
 
 def get_last_working_day(year: int, month: int) -> date:
     """Get the last working day (Mon-Fri) of a month."""
     last_day = date(year, month, calendar.monthrange(year, month)[1])
-    while last_day.weekday() >= 5:
-        last_day -= timedelta(days=1)
-    return last_day
+    weekday = last_day.weekday()
+    # Saturday (5) -> -1 day, Sunday (6) -> -2 days
+    offset = weekday - 4 if weekday >= 5 else 0
+    return last_day - timedelta(days=offset)
+
+
+@functools.lru_cache(maxsize=64)
+def _month_context(year: int, month: int) -> Dict[str, str]:
+    """Build the template context for a month; cached since every caller
+    asks about the same one or two months per invocation."""
+    month_start = date(year, month, 1)
+    return {
+        "month": month_start.strftime("%m"),
+        "month_name": month_start.strftime("%B"),
+        "month_short": month_start.strftime("%b"),
+        "year": month_start.strftime("%Y"),
+        "year_short": month_start.strftime("%y"),
+        "quarter": f"Q{(month - 1) // 3 + 1}",
+    }
 
 
 # =============================================================================
 # Templates
 # =============================================================================
 
+_CONVERSIONS = {"s": str, "r": repr, "a": ascii}
+
+
+def _compile_format(fmt: str):
+    """Parse a str.format template once and return a callable that renders it."""
+    parsed = list(string.Formatter().parse(fmt))
+
+    # Nested fields inside a format spec (e.g. {month:>{width}}) need the
+    # full str.format machinery, so don't try to precompile those.
+    if any(spec and "{" in spec for _literal, _field, spec, _conv in parsed):
+        return lambda context: fmt.format(**context)
+
+    def render(context: Dict[str, Any]) -> str:
+        parts = []
+        for literal, field, spec, conv in parsed:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                value = context[field]
+                if conv:
+                    value = _CONVERSIONS[conv](value)
+                parts.append(format(value, spec))
+        return "".join(parts)
+
+    return render
+
+
 class EpicTemplate:
     """Represents a single epic template."""
-    
+
     def __init__(self, name: str, summary_template: str, description_template: str = "",
                  labels: List[str] = None, components: List[str] = None,
                  priority: str = "Medium", custom_fields: Dict[str, Any] = None,
@@ -98,67 +161,151 @@ class EpicTemplate:
         self.priority = priority
         self.custom_fields = custom_fields or {}
         self.stories = stories or []
-    
+        self._compile()
+
+    def _compile(self):
+        self._summary_fn = _compile_format(self.summary_template)
+        self._description_fn = _compile_format(self.description_template)
+        self._story_fns = [
+            (_compile_format(story.get("summary", "")),
+             _compile_format(story.get("description", "")))
+            for story in self.stories
+        ]
+
+    def __getstate__(self):
+        # Compiled closures can't be pickled; recreate them on load.
+        state = self.__dict__.copy()
+        for key in ("_summary_fn", "_description_fn", "_story_fns"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile()
+
     def render(self, **context) -> Dict[str, Any]:
-        now = datetime.now()
-        default_context = {
-            "month": now.strftime("%m"),
-            "month_name": now.strftime("%B"),
-            "month_short": now.strftime("%b"),
-            "year": now.strftime("%Y"),
-            "year_short": now.strftime("%y"),
-            "quarter": f"Q{(now.month - 1) // 3 + 1}",
-        }
-        default_context.update(context)
-        context = default_context
-        
+        # Callers like create_monthly_epics pass a full month context that
+        # overrides every default key, so only build defaults when needed.
+        if "month" not in context:
+            now = datetime.now()
+            default_context = dict(_month_context(now.year, now.month))
+            default_context.update(context)
+            context = default_context
+
         rendered = {
-            "summary": self.summary_template.format(**context),
-            "description": self.description_template.format(**context),
+            "summary": self._summary_fn(context),
+            "description": self._description_fn(context),
             "labels": self.labels,
             "components": self.components,
             "priority": self.priority,
             "custom_fields": self.custom_fields,
         }
-        
+
         if self.stories:
             rendered["stories"] = []
-            for story in self.stories:
+            for story, (summary_fn, description_fn) in zip(self.stories, self._story_fns):
                 rendered_story = {
-                    "summary": story.get("summary", "").format(**context),
-                    "description": story.get("description", "").format(**context),
+                    "summary": summary_fn(context),
+                    "description": description_fn(context),
                     "story_points": story.get("story_points"),
                     "labels": story.get("labels", []),
                 }
                 rendered["stories"].append(rendered_story)
-        
+
         return rendered
 
 
 class TemplateManager:
     """Manages loading and organizing epic templates."""
-    
+
+    _cache_path = Path.home() / ".cache" / "jira-epic-creator" / "templates.json"
+
     def __init__(self, templates_dir: str = None):
         if templates_dir:
             self.templates_dir = Path(templates_dir)
         else:
             self.templates_dir = Path(__file__).parent / "templates"
-        
+
         self.templates: Dict[str, EpicTemplate] = {}
         self._load_templates()
-    
+
     def _load_templates(self):
         if not self.templates_dir.exists():
             return
-        
-        for template_file in self.templates_dir.glob("*.yaml"):
-            self._load_template_file(template_file)
-        for template_file in self.templates_dir.glob("*.yml"):
-            self._load_template_file(template_file)
+
+        # One scandir pass picks up both extensions and their mtimes without
+        # the per-entry stat() calls two Path.glob walks would make. Sorting
+        # keeps load order (and the cache manifest) deterministic.
+        entries = sorted(
+            (entry for entry in os.scandir(self.templates_dir)
+             if entry.name.endswith((".yaml", ".yml")) and entry.is_file()),
+            key=lambda entry: entry.path,
+        )
+        manifest = {entry.path: entry.stat().st_mtime_ns for entry in entries}
+
+        if self._load_from_cache(manifest):
+            return
+
+        for template_path in manifest:
+            self._load_template_file(Path(template_path))
+
+        self._save_cache(manifest)
+
+    @staticmethod
+    def _json_loads(data: bytes) -> Any:
+        try:
+            import orjson
+            return orjson.loads(data)
+        except ImportError:
+            return json.loads(data)
+
+    @staticmethod
+    def _json_dumps(payload: Any) -> bytes:
+        try:
+            import orjson
+            return orjson.dumps(payload)
+        except ImportError:
+            return json.dumps(payload).encode("utf-8")
+
+    def _load_from_cache(self, manifest: Dict[str, int]) -> bool:
+        """Restore parsed templates from the disk cache if no source file changed."""
+        try:
+            with open(self._cache_path, "rb") as f:
+                payload = self._json_loads(f.read())
+            if payload.get("manifest") != manifest:
+                return False
+            templates = [EpicTemplate(**data) for data in payload["templates"]]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+
+        self.templates = {template.name: template for template in templates}
+        return True
+
+    def _save_cache(self, manifest: Dict[str, int]):
+        # __getstate__ strips the compiled render closures, leaving only the
+        # plain template data, so the cache stays human-inspectable JSON.
+        payload = {
+            "manifest": manifest,
+            "templates": [template.__getstate__() for template in self.templates.values()],
+        }
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(self._json_dumps(payload))
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            pass
     
     def _load_template_file(self, file_path: Path):
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f.read(), Loader=loader)
         
         if not data:
             return
@@ -192,20 +339,52 @@ class TemplateManager:
 # JIRA Client
 # =============================================================================
 
+# Transition names that count as closing an epic
+_CLOSE_NAMES = frozenset({"done", "close", "closed", "complete", "completed", "resolve", "resolved"})
+
+# Field names JIRA instances use for an epic's start date
+_START_DATE_NAMES = ("Start date", "Start Date", "startDate")
+
+
 class JiraClient:
     """Wrapper around the JIRA API client."""
-    
-    def __init__(self, config: Config):
+
+    _cache_dir = Path.home() / ".cache" / "jira-epic-creator"
+    _fields_cache_ttl = 24 * 60 * 60  # the field schema is effectively static
+
+    def __init__(self, config: Config, refresh_fields: bool = False):
+        from jira import JIRA
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.config = config
         self._client = JIRA(
             server=self.config.jira_server,
             basic_auth=(self.config.jira_email, self.config.jira_api_token)
         )
+
+        # Size the connection pool for the threaded close/create fan-outs so
+        # workers reuse keep-alive connections instead of re-handshaking, and
+        # retry transient failures including JIRA's 429 rate limits.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+        )
+        self._client._session.mount("https://", adapter)
+        self._client._session.mount("http://", adapter)
+
+        self._refresh_fields = refresh_fields
+        self._field_id_cache: Dict[tuple, Optional[str]] = {}
+        self._field_ids_by_name: Optional[Dict[str, str]] = None
+        self._fields_lock = threading.Lock()
     
     def create_epic(self, project_key: str, summary: str, description: str = "",
                     labels: List[str] = None, components: List[str] = None,
                     priority: str = "Medium", custom_fields: Dict[str, Any] = None,
                     start_date: date = None, end_date: date = None) -> Any:
+        from jira.exceptions import JIRAError
+
         fields = {
             "project": {"key": project_key},
             "summary": summary,
@@ -222,7 +401,7 @@ class JiraClient:
             fields.update(custom_fields)
         
         if start_date:
-            start_field = self._get_field_id(["Start date", "Start Date", "startDate"])
+            start_field = self._get_field_id(_START_DATE_NAMES)
             if start_field:
                 fields[start_field] = start_date.strftime("%Y-%m-%d")
         
@@ -235,12 +414,73 @@ class JiraClient:
             raise RuntimeError(f"Failed to create epic: {e.text}") from e
     
     def _get_field_id(self, field_names: List[str]) -> Optional[str]:
+        cache_key = tuple(field_names)
+        if cache_key in self._field_id_cache:
+            return self._field_id_cache[cache_key]
+
+        if self._field_ids_by_name is None:
+            # create_epic runs from a thread pool; without the lock a cold
+            # cache would trigger one schema fetch per worker.
+            with self._fields_lock:
+                if self._field_ids_by_name is None:
+                    self._field_ids_by_name = {
+                        field["name"]: field["id"] for field in self._fetch_fields()
+                    }
+
+        field_id = None
+        for name in field_names:
+            if name in self._field_ids_by_name:
+                field_id = self._field_ids_by_name[name]
+                break
+
+        self._field_id_cache[cache_key] = field_id
+        return field_id
+
+    def _fields_cache_path(self) -> Path:
+        server_hash = hashlib.sha1(self.config.jira_server.encode("utf-8")).hexdigest()[:12]
+        return self._cache_dir / f"fields-{server_hash}.json"
+
+    def _fetch_fields(self) -> List[Dict[str, Any]]:
+        """Fetch the JIRA field schema, using a short-lived disk cache."""
+        cache_path = self._fields_cache_path()
+
+        if not self._refresh_fields:
+            try:
+                if time.time() - cache_path.stat().st_mtime < self._fields_cache_ttl:
+                    with open(cache_path, "r", encoding="utf-8") as f:
+                        return json.load(f)
+            except (OSError, ValueError):
+                pass
+
         fields = self._client.fields()
-        for field in fields:
-            if field["name"] in field_names:
-                return field["id"]
-        return None
-    
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp name keeps concurrent writers (other processes)
+            # from interleaving before the atomic replace.
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, encoding="utf-8", delete=False
+            ) as f:
+                json.dump(fields, f)
+            os.replace(f.name, cache_path)
+        except OSError:
+            pass
+        return fields
+    
+    def _search_iter(self, jql: str, batch: int = 50, fields: str = "summary,status"):
+        """Yield issues for a JQL query, fetching lazily in pages.
+
+        Requesting only the fields we actually read keeps the response
+        payload small, and consumers that stop early never trigger the
+        next page fetch.
+        """
+        start_at = 0
+        while True:
+            page = self._client.search_issues(jql, startAt=start_at, maxResults=batch, fields=fields)
+            yield from page
+            if len(page) < batch:
+                return
+            start_at += batch
+
     def epic_exists(self, project_key: str, summary: str) -> bool:
         jql = f'project = "{project_key}" AND issuetype = Epic AND summary ~ "\\"{summary}\\""'
         results = self._client.search_issues(jql, maxResults=1)
@@ -250,6 +490,8 @@ class JiraClient:
         return self._client.project(project_key)
     
     def test_connection(self) -> bool:
+        from jira.exceptions import JIRAError
+
         try:
             self._client.myself()
             return True
@@ -257,11 +499,13 @@ class JiraClient:
             return False
     
     def close_epic(self, issue_key: str) -> bool:
+        from jira.exceptions import JIRAError
+
         try:
             transitions = self._client.transitions(issue_key)
             close_transition = None
             for t in transitions:
-                if t["name"].lower() in ["done", "close", "closed", "complete", "completed", "resolve", "resolved"]:
+                if t["name"].lower() in _CLOSE_NAMES:
                     close_transition = t["id"]
                     break
             
@@ -272,8 +516,11 @@ class JiraClient:
         except JIRAError:
             return False
     
-    def find_previous_month_epics(self, project_key: str, summary_pattern: str,
-                                   current_month: int, current_year: int) -> List[Any]:
+    def iter_previous_month_epics(self, project_key: str, summary_pattern: str,
+                                   current_month: int, current_year: int):
+        """Lazily yield open epics from months before the current one."""
+        from jira.exceptions import JIRAError
+
         jql = (
             f'project = "{project_key}" '
             f'AND issuetype = Epic '
@@ -281,30 +528,45 @@ class JiraClient:
             f'AND status != Done '
             f'AND status != Closed'
         )
-        
+
+        current_suffix = self._get_month_suffix(current_month, current_year)
         try:
-            issues = self._client.search_issues(jql, maxResults=100)
-            current_suffix = self._get_month_suffix(current_month, current_year)
-            return [issue for issue in issues if current_suffix not in issue.fields.summary]
+            for issue in self._search_iter(jql):
+                if current_suffix not in issue.fields.summary:
+                    yield issue
         except JIRAError:
-            return []
+            return
     
-    def find_current_month_epics(self, project_key: str, summary_pattern: str,
-                                  month: int, year: int) -> List[Any]:
+    def find_month_epics(self, project_key: str, summary_pattern: str, month: int, year: int,
+                         extra_summaries: List[str] = None) -> List[Any]:
+        """Find this month's epics and any exact-summary matches in one query.
+
+        Matches epics carrying the month suffix (e.g. Aug'26) plus any of the
+        given candidate summaries, so one round-trip serves both the
+        duplicate-month check and the skip-if-exists filter.
+        """
+        from jira.exceptions import JIRAError
+
         month_suffix = self._get_month_suffix(month, year)
+        # The pattern only scopes the month-suffix clause; candidate
+        # summaries are matched exactly so templates whose summaries don't
+        # contain the pattern are still detected as existing.
+        clauses = [f'(summary ~ "{summary_pattern}" AND summary ~ "{month_suffix}")']
+        clauses += [f'summary ~ "\\"{s}\\""' for s in (extra_summaries or [])]
         jql = (
             f'project = "{project_key}" '
             f'AND issuetype = Epic '
-            f'AND summary ~ "{summary_pattern}" '
-            f'AND summary ~ "{month_suffix}"'
+            f'AND ({" OR ".join(clauses)})'
         )
-        
+
         try:
-            return list(self._client.search_issues(jql, maxResults=100))
+            return list(self._client.search_issues(jql, maxResults=len(clauses) + 50))
         except JIRAError:
             return []
-    
-    def _get_month_suffix(self, month: int, year: int) -> str:
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _get_month_suffix(month: int, year: int) -> str:
         month_short = date(year, month, 1).strftime("%b")
         year_short = str(year)[-2:]
         return f"{month_short}'{year_short}"
@@ -317,36 +579,54 @@ class JiraClient:
 class EpicCreator:
     """Main class for creating recurring epics from templates."""
     
-    def __init__(self, config: Config = None, templates_dir: str = None, dry_run: bool = False):
+    def __init__(self, config: Config = None, templates_dir: str = None, dry_run: bool = False,
+                 refresh_fields: bool = False):
         self.config = config or Config()
         self.template_manager = TemplateManager(templates_dir)
         self.dry_run = dry_run
+        self.refresh_fields = refresh_fields
         self._jira_client = None
-    
+        self._render_cache: Dict[tuple, Dict[str, Any]] = {}
+
     @property
     def jira_client(self) -> JiraClient:
         if self._jira_client is None:
-            self._jira_client = JiraClient(self.config)
+            self._jira_client = JiraClient(self.config, refresh_fields=self.refresh_fields)
         return self._jira_client
     
-    def check_existing_month_epics(self, month: int, year: int) -> List[Any]:
-        return self.jira_client.find_current_month_epics(
-            project_key=self.config.project_key,
-            summary_pattern="CC Gantt",
-            month=month,
-            year=year
-        )
-    
+    def _render_template(self, template_name: str, template: EpicTemplate,
+                         context: Dict[str, Any]) -> Dict[str, Any]:
+        """Render a template, memoizing per (template, year, month).
+
+        The confirmation flow in the create command runs
+        create_monthly_epics twice for the same month; the cache makes the
+        second pass reuse the first pass's rendered output.
+        """
+        if "year" not in context or "month" not in context:
+            return template.render(**context)
+
+        cache_key = (template_name, context["year"], context["month"])
+        rendered = self._render_cache.get(cache_key)
+        if rendered is None:
+            rendered = template.render(**context)
+            self._render_cache[cache_key] = rendered
+        return rendered
+
     def create_epic_from_template(self, template_name: str, skip_if_exists: bool = True,
-                                   start_date=None, end_date=None, **context) -> Optional[Dict[str, Any]]:
+                                   start_date=None, end_date=None, existing_summaries: set = None,
+                                   **context) -> Optional[Dict[str, Any]]:
         template = self.template_manager.get_template(template_name)
         if not template:
             raise ValueError(f"Template '{template_name}' not found")
-        
-        rendered = template.render(**context)
-        
+
+        rendered = self._render_template(template_name, template, context)
+
         if skip_if_exists and not self.dry_run:
-            if self.jira_client.epic_exists(self.config.project_key, rendered["summary"]):
+            if existing_summaries is not None:
+                exists = rendered["summary"] in existing_summaries
+            else:
+                exists = self.jira_client.epic_exists(self.config.project_key, rendered["summary"])
+            if exists:
                 console.print(f"[yellow]⚠ Skipping:[/yellow] Epic already exists: {rendered['summary']}")
                 return None
         
@@ -377,32 +657,76 @@ class EpicCreator:
     
     def create_monthly_epics(self, template_names: List[str] = None, month: int = None,
                               year: int = None, skip_if_exists: bool = True,
-                              close_previous: bool = True, confirmed: bool = False) -> Any:
-        now = datetime.now()
-        month = month or now.month
-        year = year or now.year
-        
-        start_date = get_first_working_day(year, month)
-        end_date = get_last_working_day(year, month)
-        
-        date_obj = datetime(year, month, 1)
-        context = {
-            "month": date_obj.strftime("%m"),
-            "month_name": date_obj.strftime("%B"),
-            "month_short": date_obj.strftime("%b"),
-            "year": date_obj.strftime("%Y"),
-            "year_short": date_obj.strftime("%y"),
-            "quarter": f"Q{(month - 1) // 3 + 1}",
-        }
-        
-        templates = template_names if template_names else self.template_manager.list_template_names()
-        
-        # Check for existing epics
-        if not self.dry_run and not confirmed:
-            existing_epics = self.check_existing_month_epics(month, year)
-            if existing_epics:
-                return {"requires_confirmation": True, "existing_epics": existing_epics, "context": context}
-        
+                              close_previous: bool = True, confirmed: bool = False,
+                              state: Dict[str, Any] = None) -> Any:
+        if state:
+            # Confirmation retry: reuse everything the first pass computed,
+            # including the JQL result, instead of querying again.
+            month = state["month"]
+            year = state["year"]
+            start_date = state["start_date"]
+            end_date = state["end_date"]
+            context = state["context"]
+            templates = state["templates"]
+            existing_summaries = state["existing_summaries"]
+        else:
+            now = datetime.now()
+            month = month or now.month
+            year = year or now.year
+
+            start_date = get_first_working_day(year, month)
+            end_date = get_last_working_day(year, month)
+
+            context = dict(_month_context(year, month))
+
+            templates = template_names if template_names else self.template_manager.list_template_names()
+
+            # One JQL query serves both the duplicate-month confirmation check
+            # and the skip-if-exists filter below.
+            existing_summaries = None
+            if not self.dry_run:
+                candidate_summaries = []
+                for template_name in templates:
+                    template = self.template_manager.get_template(template_name)
+                    if template:
+                        candidate_summaries.append(
+                            self._render_template(template_name, template, context)["summary"]
+                        )
+                month_epics = self.jira_client.find_month_epics(
+                    self.config.project_key, "CC Gantt", month, year, candidate_summaries
+                )
+                candidates = set(candidate_summaries)
+                if skip_if_exists:
+                    existing_summaries = {
+                        epic.fields.summary for epic in month_epics
+                        if epic.fields.summary in candidates
+                    }
+                if not confirmed:
+                    # Candidate matches are handled by skip-if-exists; anything
+                    # else from this month still needs explicit confirmation.
+                    if skip_if_exists:
+                        existing_epics = [
+                            epic for epic in month_epics
+                            if epic.fields.summary not in candidates
+                        ]
+                    else:
+                        existing_epics = month_epics
+                    if existing_epics:
+                        return {
+                            "requires_confirmation": True,
+                            "existing_epics": existing_epics,
+                            "context": context,
+                            "state": {
+                                "month": month,
+                                "year": year,
+                                "start_date": start_date,
+                                "end_date": end_date,
+                                "context": context,
+                                "templates": templates,
+                                "existing_summaries": existing_summaries,
+                            },
+                        }
+
         console.print(f"\n[bold]Creating epics for {context['month_name']} {context['year']}[/bold]")
         console.print(f"[dim]Start date: {start_date} (first working day)[/dim]")
         console.print(f"[dim]End date: {end_date} (last working day)[/dim]\n")
@@ -414,39 +738,53 @@ class EpicCreator:
             console.print("[blue][DRY RUN][/blue] Would close previous month's epics\n")
         
         results = []
-        for template_name in templates:
-            try:
-                result = self.create_epic_from_template(
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                executor.submit(
+                    self.create_epic_from_template,
                     template_name, skip_if_exists=skip_if_exists,
-                    start_date=start_date, end_date=end_date, **context
-                )
-                if result:
-                    results.append(result)
-            except Exception as e:
-                console.print(f"[red]✗ Error creating {template_name}:[/red] {str(e)}")
-        
+                    start_date=start_date, end_date=end_date,
+                    existing_summaries=existing_summaries, **context
+                ): template_name
+                for template_name in templates
+            }
+            for future in as_completed(futures):
+                template_name = futures[future]
+                try:
+                    result = future.result()
+                    if result:
+                        results.append(result)
+                except Exception as e:
+                    console.print(f"[red]✗ Error creating {template_name}:[/red] {str(e)}")
+
         return results
     
     def _close_previous_month_epics(self, current_month: int, current_year: int):
         console.print("[yellow]Closing previous month's epics...[/yellow]")
-        
-        previous_epics = self.jira_client.find_previous_month_epics(
+
+        previous_epics = self.jira_client.iter_previous_month_epics(
             project_key=self.config.project_key,
             summary_pattern="CC Gantt",
             current_month=current_month,
             current_year=current_year
         )
-        
-        if not previous_epics:
-            console.print("[dim]No previous month epics found to close.[/dim]\n")
-            return
-        
-        for epic in previous_epics:
-            success = self.jira_client.close_epic(epic.key)
-            if success:
-                console.print(f"[green]✓ Closed:[/green] {epic.key} - {epic.fields.summary}")
-            else:
-                console.print(f"[yellow]⚠ Could not close:[/yellow] {epic.key} (may need manual transition)")
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            # Submitting while the generator is still paging lets the first
+            # close transitions start before the search is fully consumed.
+            futures = {
+                executor.submit(self.jira_client.close_epic, epic.key): epic
+                for epic in previous_epics
+            }
+            if not futures:
+                console.print("[dim]No previous month epics found to close.[/dim]\n")
+                return
+            for future in as_completed(futures):
+                epic = futures[future]
+                if future.result():
+                    console.print(f"[green]✓ Closed:[/green] {epic.key} - {epic.fields.summary}")
+                else:
+                    console.print(f"[yellow]⚠ Could not close:[/yellow] {epic.key} (may need manual transition)")
         console.print()
     
     def list_templates(self):
@@ -455,6 +793,8 @@ class EpicCreator:
             console.print("[yellow]No templates found.[/yellow]")
             return
         
+        from rich.table import Table
+
         table = Table(title="Available Epic Templates")
         table.add_column("Name", style="cyan")
         table.add_column("Summary Template", style="white")
@@ -518,16 +858,7 @@ def preview(ctx, template_name, month, year):
         month = month or now.month
         year = year or now.year
         
-        date_obj = datetime(year, month, 1)
-        context = {
-            "month": date_obj.strftime("%m"),
-            "month_name": date_obj.strftime("%B"),
-            "month_short": date_obj.strftime("%b"),
-            "year": date_obj.strftime("%Y"),
-            "year_short": date_obj.strftime("%y"),
-            "quarter": f"Q{(month - 1) // 3 + 1}",
-        }
-        creator.preview_template(template_name, **context)
+        creator.preview_template(template_name, **_month_context(year, month))
     except Exception as e:
         console.print(f"[red]Error:[/red] {str(e)}")
 
@@ -581,11 +912,12 @@ def print_success_summary(results: List[Dict], config: Config, month: int, year:
 @click.option("--force", is_flag=True, help="Create even if epic already exists")
 @click.option("--no-close-previous", is_flag=True, help="Don't close previous month's epics")
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompts")
+@click.option("--refresh-fields", is_flag=True, help="Ignore the cached JIRA field schema")
 @click.pass_context
-def create(ctx, templates, month, year, force, no_close_previous, yes):
+def create(ctx, templates, month, year, force, no_close_previous, yes, refresh_fields):
     """Create monthly recurring epics."""
     try:
-        creator = EpicCreator(dry_run=ctx.obj["dry_run"])
+        creator = EpicCreator(dry_run=ctx.obj["dry_run"], refresh_fields=refresh_fields)
         template_names = list(templates) if templates else None
         
         # Determine actual month/year for summary
@@ -618,7 +950,8 @@ def create(ctx, templates, month, year, force, no_close_previous, yes):
             
             results = creator.create_monthly_epics(
                 template_names=template_names, month=month, year=year,
-                skip_if_exists=not force, close_previous=not no_close_previous, confirmed=True
+                skip_if_exists=not force, close_previous=not no_close_previous, confirmed=True,
+                state=results.get("state")
             )
         
         if isinstance(results, list) and results: